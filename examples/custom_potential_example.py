@@ -1,4 +1,5 @@
-import mchammer as mch  # noqa: INP001, D100
+import math  # noqa: INP001, D100
+
 import numpy as np
 import spindry as spd
 import stk
@@ -31,26 +32,7 @@ host_guest = stk.ConstructedMolecule(
     )
 )
 
-supramolecule = spd.SupraMolecule(
-    atoms=(
-        mch.Atom(
-            id=atom.get_id(),
-            element_string=atom.__class__.__name__,
-        )
-        for atom in host_guest.get_atoms()
-    ),
-    bonds=(
-        mch.Bond(
-            id=i,
-            atom_ids=(
-                bond.get_atom1().get_id(),
-                bond.get_atom2().get_id(),
-            ),
-        )
-        for i, bond in enumerate(host_guest.get_bonds())
-    ),
-    position_matrix=host_guest.get_position_matrix(),
-)
+supramolecule = spd.SupraMolecule.init_from_stk_molecule(host_guest)
 print(supramolecule)  # noqa: T201
 
 
@@ -60,24 +42,35 @@ class PotFn(spd.SpdPotential):
     def __init__(self, guest_scale: float, nonbond_epsilon: float = 5) -> None:
         """Initialize potential class."""
         self._guest_scale = guest_scale
+        self._radii: tuple[np.ndarray, ...] | None = None
+        self._scaled_radii: tuple[np.ndarray, ...] = ()
         super().__init__(nonbond_epsilon)
 
+    def _get_scaled_radii(
+        self,
+        supramolecule: spd.SupraMolecule,
+    ) -> tuple[np.ndarray, ...]:
+        """Scale the guest radii once, so the potential caches are kept."""
+        component_radii = supramolecule.get_component_radii()
+        if component_radii is not self._radii:
+            guest_radii = component_radii[1] * self._guest_scale
+            guest_radii.flags.writeable = False
+            self._scaled_radii = (
+                component_radii[0],
+                guest_radii,
+                *component_radii[2:],
+            )
+            self._radii = component_radii
+        return self._scaled_radii
+
     def compute_potential(self, supramolecule: spd.SupraMolecule) -> float:
         """Compute the potential."""
         component_position_matrices = (
-            i.get_position_matrix() for i in supramolecule.get_components()
+            supramolecule.get_component_position_matrices()
         )
-        component_radii = [
-            tuple(j.get_radius() for j in i.get_atoms())
-            for i in supramolecule.get_components()
-        ]
-
-        component_radii[1] = [
-            i * self._guest_scale for i in component_radii[1]
-        ]
         return self._compute_nonbonded_potential(
             position_matrices=component_position_matrices,
-            radii=component_radii,
+            radii=self._get_scaled_radii(supramolecule),
         )
 
 
@@ -105,9 +98,9 @@ class CentroidFn:
 
     def compute_potential(self, supramolecule: spd.SupraMolecule) -> float:
         """Compute the potential."""
-        centroids = [i.get_centroid() for i in supramolecule.get_components()]
+        centroids = supramolecule.get_component_centroids()
 
-        return 10 / np.linalg.norm(centroids[1] - centroids[0])
+        return 10 / math.dist(centroids[1], centroids[0])
 
 
 # Do not want to move, just get energy.
@@ -1,5 +1,4 @@
-import mchammer as mch  # noqa: INP001, D100
-import spindry as spd
+import spindry as spd  # noqa: INP001, D100
 import stk
 
 # Building a cage from the examples on the stk docs.
@@ -25,26 +24,7 @@ host_guest = stk.ConstructedMolecule(
 )
 host_guest.write("host_guest.mol")
 
-supramolecule = spd.SupraMolecule(
-    atoms=(
-        mch.Atom(
-            id=atom.get_id(),
-            element_string=atom.__class__.__name__,
-        )
-        for atom in host_guest.get_atoms()
-    ),
-    bonds=(
-        mch.Bond(
-            id=i,
-            atom_ids=(
-                bond.get_atom1().get_id(),
-                bond.get_atom2().get_id(),
-            ),
-        )
-        for i, bond in enumerate(host_guest.get_bonds())
-    ),
-    position_matrix=host_guest.get_position_matrix(),
-)
+supramolecule = spd.SupraMolecule.init_from_stk_molecule(host_guest)
 print(supramolecule)  # noqa: T201
 
 cg = spd.Spinner(
@@ -54,7 +34,6 @@ cg = spd.Spinner(
 )
 
 for conformer in cg.get_conformers(supramolecule):
-    print(conformer)  # noqa: T201
     print(conformer.get_cid(), conformer.get_potential())  # noqa: T201
     conformer.write_xyz_file(
         f"min_example_output/conf_{conformer.get_cid()}.xyz"
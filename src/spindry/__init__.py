@@ -7,12 +7,13 @@ from spindry._internal.potential import (
     SpdPotential,
     VaryingEpsilonPotential,
 )
-from spindry._internal.spinner import Spinner
+from spindry._internal.spinner import ParallelTemperingSpinner, Spinner
 from spindry._internal.supramolecule import SupraMolecule
 from spindry._internal.utilities import (
     calculate_centroid_distance,
     calculate_min_atom_distance,
     get_atom_distance,
+    write_xyz_trajectory,
 )
 
 __all__ = [
@@ -20,10 +21,12 @@ __all__ = [
     "VaryingEpsilonPotential",
     "SupraMolecule",
     "Spinner",
+    "ParallelTemperingSpinner",
     "Potential",
     "get_atom_distance",
     "calculate_min_atom_distance",
     "calculate_centroid_distance",
+    "write_xyz_trajectory",
     "Atom",
     "Bond",
     "Molecule",
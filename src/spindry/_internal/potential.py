@@ -6,9 +6,12 @@ import itertools as it
 from typing import TYPE_CHECKING
 
 import numpy as np
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
 
 if TYPE_CHECKING:
+    from collections import abc
+
     from .supramolecule import SupraMolecule
 
 
@@ -28,7 +31,16 @@ class Potential:
 class SpdPotential(Potential):
     """Default spindry non-bonded potential function."""
 
-    def __init__(self, nonbond_epsilon: float = 5) -> None:
+    # With a cutoff, component pairs with at least this many atom pairs
+    # find neighbours with a k-d tree instead of a full distance matrix.
+    _tree_min_pairs = 10_000
+
+    def __init__(
+        self,
+        nonbond_epsilon: float = 5,
+        cutoff: float | None = None,
+        clash_factor: float | None = None,
+    ) -> None:
         """Initialize a :class:`Spinner` instance.
 
         Parameters:
@@ -37,8 +49,39 @@ class SpdPotential(Potential):
                 Determines strength of the nonbond potential.
                 Defaults to 5.
 
+            cutoff:
+                Distance (in Angstrom) beyond which atom pairs do not
+                contribute to the nonbond potential. Defaults to ``None``,
+                where all atom pairs contribute.
+
+            clash_factor:
+                If set, the potential is ``inf`` as soon as any atom pair
+                is closer than `clash_factor` times its sigma, and the
+                remaining pairs are not evaluated. MC moves into such
+                clashes are always rejected, but the starting structure
+                must not clash. Defaults to ``None``, where the potential
+                is always summed over all pairs.
+
         """
         self._nonbond_epsilon = nonbond_epsilon
+        self._cutoff = cutoff
+        self._clash_factor = clash_factor
+        self._distance_buffers: dict[tuple[int, int], np.ndarray] = {}
+        self._sigma_radii: tuple[tuple | np.ndarray, ...] | None = None
+        self._squared_sigmas: list[np.ndarray] = []
+        self._trees: dict[int, tuple[np.ndarray, cKDTree]] = {}
+        self._pair_potentials: dict[
+            tuple[int, int], tuple[np.ndarray, np.ndarray, float]
+        ] = {}
+        self._last_pair_potentials: dict[
+            tuple[int, int], tuple[np.ndarray, np.ndarray, float]
+        ] = {}
+
+    def _get_distance_buffer(self, shape: tuple[int, int]) -> np.ndarray:
+        """Get a scratch distance matrix, reused between calls."""
+        if shape not in self._distance_buffers:
+            self._distance_buffers[shape] = np.empty(shape, dtype=np.float64)
+        return self._distance_buffers[shape]
 
     def _nonbond_potential(
         self,
@@ -50,61 +93,297 @@ class SpdPotential(Potential):
         This potential has no relation to an empircal forcefield.
 
         """
+        return self._squared_nonbond_potential(
+            squared_distance=np.square(distance),
+            squared_sigmas=np.square(sigmas),
+        )
+
+    def _squared_nonbond_potential(
+        self,
+        squared_distance: np.ndarray,
+        squared_sigmas: np.ndarray,
+    ) -> np.ndarray:
+        """Define the nonbonded potential in terms of squared distances.
+
+        Both terms are even powers of `sigmas / distance`, so no square
+        root of the distances is needed. The potential is evaluated as
+        ``epsilon * x * (x - 1)``, with ``x = (sigmas / distance) ** 6``,
+        in place on a single temporary array.
+
+        """
+        sixth_power = squared_sigmas / squared_distance
+        sixth_power *= np.square(sixth_power)
+        potential = sixth_power - 1
+        potential *= sixth_power
+        potential *= self._nonbond_epsilon
+        return potential
+
+    def _sum_squared_nonbond_potential(
+        self,
+        squared_distance: np.ndarray,
+        squared_sigmas: np.ndarray,
+    ) -> float:
+        """Sum the nonbonded potential over squared distances.
+
+        Uses ``sum(x * (x - 1)) = x . x - sum(x)``, with
+        ``x = (sigmas / distance) ** 6``, so that the terms of each pair
+        are never stored. Subclasses that override
+        :meth:`_nonbond_potential` have it summed over the distances
+        instead.
+
+        """
+        if (
+            type(self)._nonbond_potential  # noqa: SLF001
+            is not SpdPotential._nonbond_potential
+        ):
+            return float(
+                np.sum(
+                    self._nonbond_potential(
+                        distance=np.sqrt(squared_distance),
+                        sigmas=np.sqrt(squared_sigmas),
+                    )
+                )
+            )
+        ratio = squared_sigmas / squared_distance
+        sixth_power = (ratio * ratio * ratio).ravel()
         return self._nonbond_epsilon * (
-            (sigmas / distance) ** 12 - (sigmas / distance) ** 6
+            np.dot(sixth_power, sixth_power) - np.sum(sixth_power)
         )
 
-    def _combine_sigma(self, radii1: tuple, radii2: tuple) -> np.ndarray:
+    def _combine_sigma(
+        self,
+        radii1: tuple | np.ndarray,
+        radii2: tuple | np.ndarray,
+    ) -> np.ndarray:
         """Combine radii using Lorentz-Berthelot rules."""
-        len1 = len(radii1)
-        len2 = len(radii2)
+        return (
+            np.add.outer(
+                np.asarray(radii1, dtype=np.float64),
+                np.asarray(radii2, dtype=np.float64),
+            )
+            / 2
+        )
+
+    def _get_squared_sigmas(
+        self,
+        radii: abc.Sequence[tuple | np.ndarray],
+    ) -> list[np.ndarray]:
+        """Get the squared sigmas of each pair of components.
+
+        Radii do not change during an MC run, so the sigmas are only
+        recomputed when the radii of a component are not the same
+        read-only array, or tuple, as in the last call.
+
+        """
+        radii = tuple(radii)
+        if self._sigma_radii is None or not _are_same_radii(
+            radii, self._sigma_radii
+        ):
+            self._squared_sigmas = [
+                np.square(self._combine_sigma(*radii_pair))
+                for radii_pair in it.combinations(radii, 2)
+            ]
+            self._sigma_radii = radii
+            self._pair_potentials = {}
+            self._last_pair_potentials = {}
+        return self._squared_sigmas
+
+    def _get_all_pairs(
+        self,
+        position_matrix1: np.ndarray,
+        position_matrix2: np.ndarray,
+        squared_sigmas: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get squared distances and sigmas from a full distance matrix."""
+        squared_dists = cdist(
+            position_matrix1,
+            position_matrix2,
+            "sqeuclidean",
+            out=self._get_distance_buffer(
+                (len(position_matrix1), len(position_matrix2))
+            ),
+        )
+        if self._cutoff is not None:
+            in_cutoff = squared_dists < self._cutoff**2
+            return squared_dists[in_cutoff], squared_sigmas[in_cutoff]
+        return squared_dists, squared_sigmas
 
-        mixed = np.zeros((len1, len2))
-        for i in range(len1):
-            for j in range(len2):
-                mixed[i, j] = (radii1[i] + radii2[j]) / 2
+    def _get_tree(self, position_matrix: np.ndarray) -> cKDTree:
+        """Get a k-d tree of `position_matrix`.
 
-        return mixed
+        Trees of read-only position matrices, such as those cached by
+        :class:`.SupraMolecule`, are kept while the same matrix is passed,
+        so the tree of a component that has not moved is not rebuilt.
+
+        """
+        if position_matrix.flags.writeable:
+            return cKDTree(position_matrix)
+        cached = self._trees.get(id(position_matrix))
+        if cached is None or cached[0] is not position_matrix:
+            cached = (position_matrix, cKDTree(position_matrix))
+            self._trees[id(position_matrix)] = cached
+        return cached[1]
+
+    def _get_neighbour_pairs(
+        self,
+        position_matrix1: np.ndarray,
+        position_matrix2: np.ndarray,
+        squared_sigmas: np.ndarray,
+        cutoff: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get squared distances and sigmas of pairs within the cutoff.
+
+        Distances are only computed to the atoms of the larger component
+        within the cutoff of the bounding sphere of the smaller one. These
+        atoms are found with a k-d tree, which scales better than a full
+        distance matrix for large components.
+
+        """
+        if len(position_matrix1) < len(position_matrix2):
+            position_matrix1, position_matrix2 = (
+                position_matrix2,
+                position_matrix1,
+            )
+            squared_sigmas = squared_sigmas.T
+
+        centroid = position_matrix2.mean(axis=0)
+        radius = np.sqrt(
+            np.max(np.sum(np.square(position_matrix2 - centroid), axis=1))
+        )
+        neighbour_ids = np.asarray(
+            self._get_tree(position_matrix1).query_ball_point(
+                x=centroid,
+                r=radius + cutoff,
+            ),
+            dtype=np.intp,
+        )
+        squared_dists = cdist(
+            position_matrix1[neighbour_ids],
+            position_matrix2,
+            "sqeuclidean",
+        )
+        in_cutoff = squared_dists < cutoff**2
+        return (
+            squared_dists[in_cutoff],
+            squared_sigmas[neighbour_ids][in_cutoff],
+        )
+
+    def _compute_pair_potential(
+        self,
+        position_matrix1: np.ndarray,
+        position_matrix2: np.ndarray,
+        squared_sigmas: np.ndarray,
+    ) -> float:
+        """Compute the nonbond potential between two components."""
+        if (
+            self._cutoff is not None
+            and squared_sigmas.size >= self._tree_min_pairs
+        ):
+            squared_dists, squared_sigmas = self._get_neighbour_pairs(
+                position_matrix1=position_matrix1,
+                position_matrix2=position_matrix2,
+                squared_sigmas=squared_sigmas,
+                cutoff=self._cutoff,
+            )
+        else:
+            squared_dists, squared_sigmas = self._get_all_pairs(
+                position_matrix1=position_matrix1,
+                position_matrix2=position_matrix2,
+                squared_sigmas=squared_sigmas,
+            )
+        if self._clash_factor is not None and np.any(
+            squared_dists < self._clash_factor**2 * squared_sigmas
+        ):
+            return np.inf
+        return self._sum_squared_nonbond_potential(
+            squared_distance=squared_dists,
+            squared_sigmas=squared_sigmas,
+        )
 
     def _compute_nonbonded_potential(
         self,
-        position_matrices: list[np.ndarray],
-        radii: list[tuple],
+        position_matrices: abc.Iterable[np.ndarray],
+        radii: abc.Sequence[tuple | np.ndarray],
     ) -> float:
-        nonbonded_potential = 0
-        for pos_mat_pair, radii_pair in zip(
+        """Compute the nonbond potential summed over component pairs.
+
+        The potential of a pair of read-only position matrices, such as
+        those cached by :class:`.SupraMolecule`, is kept for the next two
+        calls. In an MC step, only the pairs that include the moved
+        component are then recomputed.
+
+        """
+        position_matrices = tuple(position_matrices)
+        all_squared_sigmas = self._get_squared_sigmas(radii)
+        # Drop trees of components that have since moved.
+        self._trees = {
+            key: cached
+            for key, cached in self._trees.items()
+            if any(cached[0] is i for i in position_matrices)
+        }
+
+        pair_potentials: dict[
+            tuple[int, int], tuple[np.ndarray, np.ndarray, float]
+        ] = {}
+        nonbonded_potential = 0.0
+        for (pos_mat1, pos_mat2), pair_sigmas in zip(
             it.combinations(position_matrices, 2),
-            it.combinations(radii, 2),
+            all_squared_sigmas,
             strict=True,
         ):
-            pair_dists = cdist(pos_mat_pair[0], pos_mat_pair[1])
-            sigmas = self._combine_sigma(radii_pair[0], radii_pair[1])
-            nonbonded_potential += np.sum(
-                self._nonbond_potential(
-                    distance=pair_dists.flatten(),
-                    sigmas=sigmas.flatten(),
+            key = (id(pos_mat1), id(pos_mat2))
+            cached = self._pair_potentials.get(key)
+            if (
+                cached is not None
+                and cached[0] is pos_mat1
+                and cached[1] is pos_mat2
+            ):
+                pair_potential = cached[2]
+            else:
+                pair_potential = self._compute_pair_potential(
+                    position_matrix1=pos_mat1,
+                    position_matrix2=pos_mat2,
+                    squared_sigmas=pair_sigmas,
                 )
-            )
-
+            if not (pos_mat1.flags.writeable or pos_mat2.flags.writeable):
+                pair_potentials[key] = (pos_mat1, pos_mat2, pair_potential)
+            nonbonded_potential += pair_potential
+            if pair_potential == np.inf:
+                break
+
+        # Keep the pairs of the previous call too, which are those of the
+        # current conformer if the last MC move was rejected.
+        self._pair_potentials = self._last_pair_potentials | pair_potentials
+        self._last_pair_potentials = pair_potentials
         return nonbonded_potential
 
     def compute_potential(self, supramolecule: SupraMolecule) -> float:
         """Compute the potential energy of a supramolecule."""
-        component_position_matrices = [
-            i.get_position_matrix() for i in supramolecule.get_components()
-        ]
-        component_radii = [
-            tuple(j.get_radius() for j in i.get_atoms())
-            for i in supramolecule.get_components()
-        ]
         return self._compute_nonbonded_potential(
-            position_matrices=component_position_matrices,
-            radii=component_radii,
+            position_matrices=supramolecule.get_component_position_matrices(),
+            radii=supramolecule.get_component_radii(),
         )
 
 
 class VaryingEpsilonPotential(Potential):
-    """A non-bonded potential function with varying epsilons."""
+    """A non-bonded potential function with varying epsilons.
+
+    The `sigma` and `epsilon` of each atom are read on the first call
+    for a set of atoms, and are then fixed. Changing them on the atoms
+    afterwards has no effect, so use a new instance instead.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize a :class:`VaryingEpsilonPotential` instance."""
+        self._parameter_atoms: tuple | None = None
+        self._component_parameters: tuple[list[tuple], list[tuple]] = (
+            [],
+            [],
+        )
+        self._parameter_radii: abc.Sequence[tuple] | None = None
+        self._parameter_epsilons: abc.Sequence[tuple] | None = None
+        self._pair_parameters: list[tuple[np.ndarray, np.ndarray]] = []
 
     def _nonbond_potential(
         self,
@@ -117,77 +396,152 @@ class VaryingEpsilonPotential(Potential):
         This potential has no relation to an empircal forcefield.
 
         """
-        return epsilons * (
-            (sigmas / distance) ** 12 - (sigmas / distance) ** 6
+        return self._squared_nonbond_potential(
+            squared_distance=np.square(distance),
+            squared_sigmas=np.square(sigmas),
+            epsilons=epsilons,
         )
 
-    def _combine_sigma(self, radii1: tuple, radii2: tuple) -> np.ndarray:
-        """Combine radii using Lorentz-Berthelot rules."""
-        len1 = len(radii1)
-        len2 = len(radii2)
+    def _squared_nonbond_potential(
+        self,
+        squared_distance: np.ndarray,
+        squared_sigmas: np.ndarray,
+        epsilons: np.ndarray,
+    ) -> np.ndarray:
+        """Define the nonbonded potential in terms of squared distances.
 
-        mixed = np.zeros((len1, len2))
-        for i in range(len1):
-            for j in range(len2):
-                mixed[i, j] = (radii1[i] + radii2[j]) / 2
+        Both terms are even powers of `sigmas / distance`, so no square
+        root of the distances is needed.
+
+        """
+        sixth_power = squared_sigmas / squared_distance
+        sixth_power *= np.square(sixth_power)
+        potential = sixth_power - 1
+        potential *= sixth_power
+        potential *= epsilons
+        return potential
 
-        return mixed
+    def _combine_sigma(self, radii1: tuple, radii2: tuple) -> np.ndarray:
+        """Combine radii using Lorentz-Berthelot rules."""
+        return (
+            np.add.outer(
+                np.asarray(radii1, dtype=np.float64),
+                np.asarray(radii2, dtype=np.float64),
+            )
+            / 2
+        )
 
     def _combine_epsilon(self, e1: tuple, e2: tuple) -> np.ndarray:
         """Combine epsilon using Lorentz-Berthelot rules."""
-        len1 = len(e1)
-        len2 = len(e2)
+        return np.sqrt(
+            np.multiply.outer(
+                np.asarray(e1, dtype=np.float64),
+                np.asarray(e2, dtype=np.float64),
+            )
+        )
 
-        mixed = np.zeros((len1, len2))
-        for i in range(len1):
-            for j in range(len2):
-                mixed[i, j] = np.sqrt(e1[i] * e2[j])
+    def _get_pair_parameters(
+        self,
+        radii: abc.Sequence[tuple],
+        epsilons: abc.Sequence[tuple],
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Get the squared sigmas and epsilons of each pair of components.
+
+        These do not change during an MC run, so they are only
+        recomputed when different `radii` or `epsilons` objects are
+        passed.
 
-        return mixed
+        """
+        if (
+            radii is not self._parameter_radii
+            or epsilons is not self._parameter_epsilons
+        ):
+            self._pair_parameters = [
+                (
+                    np.square(self._combine_sigma(*radii_pair)),
+                    self._combine_epsilon(*epsilon_pair),
+                )
+                for radii_pair, epsilon_pair in zip(
+                    it.combinations(radii, 2),
+                    it.combinations(epsilons, 2),
+                    strict=True,
+                )
+            ]
+            self._parameter_radii = radii
+            self._parameter_epsilons = epsilons
+        return self._pair_parameters
 
     def _compute_nonbonded_potential(
         self,
-        position_matrices: list[np.ndarray],
-        radii: list[tuple],
-        epsilons: list[tuple],
+        position_matrices: abc.Sequence[np.ndarray],
+        radii: abc.Sequence[tuple],
+        epsilons: abc.Sequence[tuple],
     ) -> float:
-        nonbonded_potential = 0
-        for pos_mat_pair, radii_pair, epsilon_pair in zip(
+        nonbonded_potential = 0.0
+        for pos_mat_pair, (squared_sigmas, pair_epsilons) in zip(
             it.combinations(position_matrices, 2),
-            it.combinations(radii, 2),
-            it.combinations(epsilons, 2),
+            self._get_pair_parameters(radii, epsilons),
             strict=True,
         ):
-            pair_dists = cdist(pos_mat_pair[0], pos_mat_pair[1])
-            new_radii = self._combine_sigma(radii_pair[0], radii_pair[1])
-            new_epsilons = self._combine_epsilon(
-                epsilon_pair[0], epsilon_pair[1]
+            squared_dists = cdist(
+                pos_mat_pair[0],
+                pos_mat_pair[1],
+                "sqeuclidean",
             )
             nonbonded_potential += np.sum(
-                self._nonbond_potential(
-                    distance=pair_dists.flatten(),
-                    sigmas=new_radii.flatten(),
-                    epsilons=new_epsilons.flatten(),
+                self._squared_nonbond_potential(
+                    squared_distance=squared_dists,
+                    squared_sigmas=squared_sigmas,
+                    epsilons=pair_epsilons,
                 )
             )
 
         return nonbonded_potential
 
+    def _get_component_parameters(
+        self,
+        supramolecule: SupraMolecule,
+    ) -> tuple[list[tuple], list[tuple]]:
+        """Get the sigmas and epsilons of the atoms in each component.
+
+        Conformers from an MC run share their atoms, so the parameters
+        are only collected again for a supramolecule with other atoms.
+        Changes to the `sigma` or `epsilon` of the same atoms are not
+        picked up.
+
+        """
+        if supramolecule.atoms is not self._parameter_atoms:
+            components = list(supramolecule.get_components())
+            self._component_parameters = (
+                [tuple(j.sigma for j in i.get_atoms()) for i in components],
+                [tuple(j.epsilon for j in i.get_atoms()) for i in components],
+            )
+            self._parameter_atoms = supramolecule.atoms
+        return self._component_parameters
+
     def compute_potential(self, supramolecule: SupraMolecule) -> float:
         """Compure the potential of the molecule."""
-        component_position_matrices = [
-            i.get_position_matrix() for i in supramolecule.get_components()
-        ]
-        component_radii = [
-            tuple(j.sigma for j in i.get_atoms())
-            for i in supramolecule.get_components()
-        ]
-        component_epsilon = [
-            tuple(j.epsilon for j in i.get_atoms())
-            for i in supramolecule.get_components()
-        ]
+        component_radii, component_epsilon = self._get_component_parameters(
+            supramolecule
+        )
         return self._compute_nonbonded_potential(
-            position_matrices=component_position_matrices,
+            position_matrices=supramolecule.get_component_position_matrices(),
             radii=component_radii,
             epsilons=component_epsilon,
         )
+
+
+def _are_same_radii(
+    radii: tuple[tuple | np.ndarray, ...],
+    cached_radii: tuple[tuple | np.ndarray, ...],
+) -> bool:
+    """Check if radii are the same unchangeable objects as cached ones.
+
+    Writeable arrays can be edited in place, so they never match.
+
+    """
+    return len(radii) == len(cached_radii) and all(
+        new is old
+        and not (isinstance(new, np.ndarray) and new.flags.writeable)
+        for new, old in zip(radii, cached_radii, strict=True)
+    )
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import copy
+import math
+import multiprocessing
 from typing import TYPE_CHECKING
 
-import mchammer as mch
 import numpy as np
 
 from .potential import SpdPotential
@@ -13,6 +15,8 @@ from .supramolecule import SupraMolecule
 if TYPE_CHECKING:
     from collections import abc
 
+    import mchammer as mch
+
     from .potential import Potential
 
 
@@ -24,7 +28,7 @@ class Spinner:
 
     """
 
-    def __init__(  # noqa: PLR0913
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         step_size: float,
         rotation_step_size: float,
@@ -33,6 +37,8 @@ class Spinner:
         potential_function: Potential | None = None,
         beta: float = 2,
         random_seed: int | None = 1000,
+        *,
+        rescoring_function: Potential | None = None,
     ) -> None:
         """Initialize a :class:`Spinner` instance.
 
@@ -63,6 +69,14 @@ class Spinner:
                 ``None`` if system-based random seed is desired. Defaults
                 to a set seed of 1000, to avoid randomness.
 
+            rescoring_function:
+                Function to recalculate the potential energy of each
+                yielded conformer, for example a :class:`.SpdPotential`
+                without a cutoff when `potential_function` uses one to
+                speed up the MC moves. MC moves are always accepted based
+                on `potential_function`. Defaults to ``None``, where
+                conformers keep the potential from `potential_function`.
+
         """
         self._step_size = step_size
         self._num_conformers = num_conformers
@@ -77,82 +91,159 @@ class Spinner:
             self._generator = np.random.default_rng()
         else:
             self._generator = np.random.default_rng(random_seed)
+        self._rescoring_function = rescoring_function
+
+    def _rescore(
+        self,
+        supramolecule: SupraMolecule,
+        potential: float,
+    ) -> float:
+        if self._rescoring_function is None:
+            return potential
+        return self._rescoring_function.compute_potential(supramolecule)
 
     def compute_potential(self, supramolecule: SupraMolecule) -> float:
         """Compute the potential of a supramolecule."""
         return self._potential_function.compute_potential(supramolecule)
 
-    def _run_step(
+    def _get_movable_components(
         self,
         supramolecule: SupraMolecule,
         movable_components: tuple[int, ...] | None,
-    ) -> tuple[SupraMolecule, float]:
-        component_list = list(supramolecule.get_components())
-        component_sizes = {
-            i: mol.get_num_atoms() for i, mol in enumerate(component_list)
-        }
-        max_size = max(component_sizes.values())
+    ) -> list[int]:
+        component_sizes = [
+            mol.get_num_atoms() for mol in supramolecule.get_components()
+        ]
+        max_size = max(component_sizes)
 
         # If movable components not set, select a guest randomly to
         # move and reorient.
         # Do not move or rotate largest component.
         if movable_components is None:
             # If there are different sizes.
-            if len(set(component_sizes.values())) > 1:
+            if len(set(component_sizes)) > 1:
                 movable_components = tuple(
                     i
-                    for i in range(len(component_list))
-                    if component_sizes[i] != max_size
+                    for i, size in enumerate(component_sizes)
+                    if size != max_size
                 )
             # Else capture all!
             else:
-                movable_components = tuple(
-                    i for i in range(len(component_list))
-                )
+                movable_components = tuple(range(len(component_sizes)))
 
-        targ_comp_id = self._generator.choice(
-            [i for i in range(len(component_list)) if i in movable_components]
+        return [
+            i for i in range(len(component_sizes)) if i in movable_components
+        ]
+
+    def _run_step(
+        self,
+        supramolecule: SupraMolecule,
+        movable_components: list[int],
+    ) -> tuple[SupraMolecule, float]:
+        component_list = list(supramolecule.get_components())
+        centroid_list = list(supramolecule.get_component_centroids())
+        position_matrix_list = list(
+            supramolecule.get_component_position_matrices()
         )
+        # Same draw as Generator.choice, without converting the list to
+        # an array on every step.
+        targ_comp_id = movable_components[
+            self._generator.integers(len(movable_components))
+        ]
 
         targ_comp = component_list[targ_comp_id]
 
-        # Random number from -1 to 1 for multiplying translation.
-        rand = (self._generator.random() - 0.5) * 2
+        # Random numbers from -1 to 1 for multiplying the translation
+        # and the rotation.
+        rand_numbers = (self._generator.random(2) - 0.5) * 2
 
-        # Random translation direction.
-        rand_vector = self._generator.random(3)
-        rand_vector = rand_vector / np.linalg.norm(rand_vector)
+        # Random translation direction and rotation axis, drawn from
+        # normal distributions so that both are uniform on the sphere.
+        directions = self._generator.standard_normal((2, 3))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        rand_vector, rand_axis = directions
 
-        # Perform translation.
-        translation_vector = rand_vector * self._step_size * rand
-        targ_comp = mch.translate_molecule_along_vector(
-            mol=targ_comp,
-            vector=translation_vector,
-        )
+        translation_vector = rand_vector * self._step_size * rand_numbers[0]
 
         # Define a random rotation of the guest.
-        # Random number from -1 to 1 for multiplying rotation.
-        rand = (self._generator.random() - 0.5) * 2
-        rotation_angle = self._rotation_step_size * rand
-        rand_axis = self._generator.random(3)
-        rand_axis = rand_axis / np.linalg.norm(rand_vector)
-
-        # Perform rotation.
-        targ_comp = mch.rotate_molecule_by_angle(
-            mol=targ_comp,
+        rotation_angle = self._rotation_step_size * rand_numbers[1]
+        rotation_matrix = _rotation_matrix(
             angle=rotation_angle,
             axis=rand_axis,
-            origin=targ_comp.get_centroid(),
         )
 
+        # Perform translation and rotation about the centroid of the
+        # component together, applying a single 3x3 rotation matrix to
+        # all atom positions at once. The translation moves the centroid
+        # by the same vector, so positions relative to the centroid are
+        # those before the translation.
+        centroid = centroid_list[targ_comp_id] + translation_vector
+        position_matrix = (
+            position_matrix_list[targ_comp_id] - centroid_list[targ_comp_id]
+        ) @ rotation_matrix.T
+        position_matrix += centroid
+        targ_comp = targ_comp.with_position_matrix(position_matrix)
+
+        # A rotation about the centroid leaves the centroid unchanged.
         component_list[targ_comp_id] = targ_comp
-        supramolecule = SupraMolecule.init_from_components(
+        centroid_list[targ_comp_id] = centroid
+        position_matrix_list[targ_comp_id] = position_matrix
+        supramolecule = supramolecule._with_components(  # noqa: SLF001
             components=component_list,
+            centroids=centroid_list,
+            position_matrices=position_matrix_list,
         )
 
         nonbonded_potential = self.compute_potential(supramolecule)
         return supramolecule, nonbonded_potential
 
+    def _get_initial_conformer(
+        self,
+        supramolecule: SupraMolecule,
+    ) -> tuple[SupraMolecule, float]:
+        nonbonded_potential = self.compute_potential(supramolecule)
+
+        # Atoms are reordered by component, which allows cheap clones of
+        # the supramolecule to be made at each step.
+        supramolecule = SupraMolecule.init_from_components(
+            components=list(supramolecule.get_components()),
+            cid=0,
+        )
+        supramolecule.potential = self._rescore(
+            supramolecule=supramolecule,
+            potential=nonbonded_potential,
+        )
+        return supramolecule, nonbonded_potential
+
+    def _attempt_move(
+        self,
+        supramolecule: SupraMolecule,
+        nonbonded_potential: float,
+        movable_components: list[int],
+    ) -> tuple[SupraMolecule, float, bool]:
+        n_supramolecule, n_nonbonded_potential = self._run_step(
+            supramolecule=supramolecule,
+            movable_components=movable_components,
+        )
+        passed = self._test_move(
+            curr_pot=nonbonded_potential,
+            new_pot=n_nonbonded_potential,
+        )
+        return n_supramolecule, n_nonbonded_potential, passed
+
+    def _test_move(self, curr_pot: float, new_pot: float) -> bool:
+        """Test an MC move with the Metropolis criterion.
+
+        Matches :func:`mch.test_move`, including only drawing a random
+        number for uphill moves, but uses scalar :func:`math.exp`.
+
+        """
+        if new_pot < curr_pot:
+            return True
+        return math.exp(-self._beta * (new_pot - curr_pot)) > (
+            self._generator.random()
+        )
+
     def get_conformers(
         self,
         supramolecule: SupraMolecule,
@@ -177,46 +268,43 @@ class Spinner:
 
         """
         cid = 0
-        nonbonded_potential = self.compute_potential(supramolecule)
-
-        yield SupraMolecule.init_from_components(
-            components=list(supramolecule.get_components()),
-            cid=cid,
-            potential=nonbonded_potential,
+        supramolecule, nonbonded_potential = self._get_initial_conformer(
+            supramolecule
+        )
+        yield supramolecule
+        # The components to move do not change between steps.
+        movable_list = self._get_movable_components(
+            supramolecule=supramolecule,
+            movable_components=movable_components,
         )
-        cids_passed = []
         count = 0
-        for _ in range(1, self._max_attempts):
-            n_supramolecule, n_nonbonded_potential = self._run_step(
-                supramolecule=supramolecule,
-                movable_components=movable_components,
-            )
-            passed = mch.test_move(
-                beta=self._beta,
-                curr_pot=nonbonded_potential,
-                new_pot=n_nonbonded_potential,
-                generator=self._generator,
+        for _ in range(self._max_attempts):
+            n_supramolecule, n_nonbonded_potential, passed = (
+                self._attempt_move(
+                    supramolecule=supramolecule,
+                    nonbonded_potential=nonbonded_potential,
+                    movable_components=movable_list,
+                )
             )
             if passed:
                 cid += 1
-                cids_passed.append(cid)
                 nonbonded_potential = n_nonbonded_potential
-                supramolecule = SupraMolecule.init_from_components(
-                    components=list(n_supramolecule.get_components()),
-                    cid=cid,
+                # The trial supramolecule is kept, rather than rebuilt, so
+                # that the cached radii and host positions carry over.
+                supramolecule = n_supramolecule
+                supramolecule.cid = cid
+                supramolecule.potential = self._rescore(
+                    supramolecule=supramolecule,
                     potential=nonbonded_potential,
                 )
-                supramolecule = supramolecule.with_position_matrix(
-                    n_supramolecule.get_position_matrix()
-                )
                 yield supramolecule
             count += 1
-            if len(cids_passed) == self._num_conformers:
+            if cid == self._num_conformers:
                 break
 
         if verbose:
             print(  # noqa: T201
-                f"{len(cids_passed)} conformers generated in {count} steps."
+                f"{cid} conformers generated in {count} steps."
             )
 
     def get_final_conformer(
@@ -247,3 +335,370 @@ class Spinner:
             continue
 
         return conformer
+
+    def _with_random_seed(
+        self,
+        random_seed: int | np.random.SeedSequence | None,
+    ) -> Spinner:
+        """Return a clone with an independent random number generator."""
+        clone = copy.copy(self)
+        clone._generator = np.random.default_rng(random_seed)  # noqa: SLF001
+        return clone
+
+    def _with_beta(self, beta: float) -> Spinner:
+        """Return a clone at another beta, with its own potential.
+
+        The potential is copied, so that any caches it keeps between
+        calls follow the MC chain of the clone only.
+
+        """
+        clone = copy.copy(self)
+        clone._beta = beta  # noqa: SLF001
+        clone._potential_function = copy.copy(self._potential_function)  # noqa: SLF001
+        return clone
+
+    def get_final_conformers(
+        self,
+        supramolecule: SupraMolecule,
+        random_seeds: abc.Iterable[int | None],
+        movable_components: tuple[int, ...] | None = None,
+        num_processes: int = 1,
+    ) -> list[SupraMolecule]:
+        """Get final conformers of independent MC chains.
+
+        Each chain starts from `supramolecule` and uses the settings of
+        this :class:`Spinner`, but with its own random seed.
+
+        Parameters:
+            supramolecule:
+                The supramolecule to optimize.
+
+            random_seeds:
+                Random seed of each chain. One chain is run per seed.
+
+            movable_components:
+                Components of supramolecule to move during simulation.
+                If `None`, then moved components are selected randomly,
+                and the largest component (host) is not moved.
+
+            num_processes:
+                Number of processes to run the chains in. The potential
+                function must be picklable if this is greater than 1.
+                Defaults to 1.
+
+        Returns:
+            conformers:
+                The final conformer of each chain, ordered as
+                `random_seeds`.
+
+        """
+        return self._run_chains(
+            function=_run_chain,
+            supramolecule=supramolecule,
+            random_seeds=random_seeds,
+            movable_components=movable_components,
+            num_processes=num_processes,
+        )
+
+    def get_chain_conformers(
+        self,
+        supramolecule: SupraMolecule,
+        random_seeds: abc.Iterable[int | None],
+        movable_components: tuple[int, ...] | None = None,
+        num_processes: int = 1,
+    ) -> list[list[SupraMolecule]]:
+        """Get all conformers of independent MC chains.
+
+        Each chain starts from `supramolecule` and uses the settings of
+        this :class:`Spinner`, but with its own random seed.
+
+        Parameters:
+            supramolecule:
+                The supramolecule to optimize.
+
+            random_seeds:
+                Random seed of each chain. One chain is run per seed.
+
+            movable_components:
+                Components of supramolecule to move during simulation.
+                If `None`, then moved components are selected randomly,
+                and the largest component (host) is not moved.
+
+            num_processes:
+                Number of processes to run the chains in. The potential
+                function must be picklable if this is greater than 1.
+                Defaults to 1.
+
+        Returns:
+            conformers:
+                The conformers yielded by each chain, as in
+                :meth:`get_conformers`, ordered as `random_seeds`.
+
+        """
+        return self._run_chains(
+            function=_run_chain_conformers,
+            supramolecule=supramolecule,
+            random_seeds=random_seeds,
+            movable_components=movable_components,
+            num_processes=num_processes,
+        )
+
+    def _run_chains(
+        self,
+        function: abc.Callable,
+        supramolecule: SupraMolecule,
+        random_seeds: abc.Iterable[int | None],
+        movable_components: tuple[int, ...] | None,
+        num_processes: int,
+    ) -> list:
+        chains = [
+            (self._with_random_seed(seed), supramolecule, movable_components)
+            for seed in random_seeds
+        ]
+        if num_processes == 1:
+            return [function(*chain) for chain in chains]
+
+        with multiprocessing.Pool(num_processes) as pool:
+            return pool.starmap(function, chains)
+
+
+class ParallelTemperingSpinner:
+    """Generate host-guest conformations by replica exchange MC.
+
+    Replicas of a :class:`Spinner` run the same MC moves at different
+    values of beta. Every `swap_every` steps, neighbouring replicas try
+    to swap conformers, which is accepted with probability
+    ``min(1, exp((beta_i - beta_j) * (E_i - E_j)))``. Conformers found by
+    hot replicas, which cross barriers more easily, can then reach the
+    replica at the first beta, whose conformers are yielded.
+
+    """
+
+    def __init__(
+        self,
+        spinner: Spinner,
+        betas: abc.Sequence[float],
+        swap_every: int = 50,
+        random_seed: int | None = 1000,
+    ) -> None:
+        """Initialize a :class:`ParallelTemperingSpinner` instance.
+
+        Parameters:
+            spinner:
+                The MC settings of every replica, apart from beta. Its
+                `num_conformers` and `max_attempts` apply to the replica
+                at the first beta.
+
+            betas:
+                Value of beta of each replica. Conformers are yielded from
+                the replica at the first beta, and swaps are attempted
+                between neighbouring betas.
+
+            swap_every:
+                Number of MC steps between swap attempts. Defaults to 50.
+
+            random_seed:
+                Random seed from which the seeds of the replicas and of
+                the swaps are drawn. Should only be set to ``None`` if
+                system-based random seed is desired. Defaults to a set
+                seed of 1000, to avoid randomness.
+
+        """
+        self._spinner = spinner
+        self._betas = tuple(betas)
+        self._swap_every = swap_every
+        self._random_seed = random_seed
+
+    def get_conformers(
+        self,
+        supramolecule: SupraMolecule,
+        movable_components: tuple[int, ...] | None = None,
+        verbose: bool = False,  # noqa: FBT001, FBT002
+    ) -> abc.Iterable[SupraMolecule]:
+        """Get conformers of supramolecule.
+
+        Parameters:
+            supramolecule:
+                The supramolecule to optimize.
+
+            movable_components:
+                Components of supramolecule to move during simulation.
+
+            verbose:
+                `True` to print some extra information.
+
+        Yields:
+            conformer: :class:`.SupraMolecule`
+                The host-guest supramolecule of the replica at the first
+                beta, each time its conformer changes.
+
+        """
+        *replica_seeds, swap_seed = np.random.SeedSequence(
+            self._random_seed
+        ).spawn(len(self._betas) + 1)
+        generator = np.random.default_rng(swap_seed)
+        replicas = [
+            self._spinner._with_random_seed(seed)._with_beta(beta)  # noqa: SLF001
+            for seed, beta in zip(replica_seeds, self._betas, strict=True)
+        ]
+        states = [
+            replica._get_initial_conformer(supramolecule)  # noqa: SLF001
+            for replica in replicas
+        ]
+        yield states[0][0]
+        movable_list = replicas[0]._get_movable_components(  # noqa: SLF001
+            supramolecule=states[0][0],
+            movable_components=movable_components,
+        )
+
+        cid = 0
+        num_swaps = 0
+        count = 0
+        max_attempts = self._spinner._max_attempts  # noqa: SLF001
+        for step in range(1, max_attempts + 1):
+            changed = False
+            for i, replica in enumerate(replicas):
+                n_supramolecule, n_nonbonded_potential, passed = (
+                    replica._attempt_move(  # noqa: SLF001
+                        supramolecule=states[i][0],
+                        nonbonded_potential=states[i][1],
+                        movable_components=movable_list,
+                    )
+                )
+                if passed:
+                    states[i] = (n_supramolecule, n_nonbonded_potential)
+                    changed = changed or i == 0
+
+            if step % self._swap_every == 0:
+                for i in range(len(replicas) - 1):
+                    exponent = (self._betas[i] - self._betas[i + 1]) * (
+                        states[i][1] - states[i + 1][1]
+                    )
+                    if exponent >= 0 or generator.random() < math.exp(
+                        exponent
+                    ):
+                        states[i], states[i + 1] = states[i + 1], states[i]
+                        num_swaps += 1
+                        changed = changed or i == 0
+
+            count += 1
+            if changed:
+                cid += 1
+                yield self._get_conformer(*states[0], cid=cid)
+                if cid == self._spinner._num_conformers:  # noqa: SLF001
+                    break
+
+        if verbose:
+            print(  # noqa: T201
+                f"{cid} conformers generated in {count} steps, with "
+                f"{num_swaps} replica swaps."
+            )
+
+    def _get_conformer(
+        self,
+        supramolecule: SupraMolecule,
+        nonbonded_potential: float,
+        cid: int,
+    ) -> SupraMolecule:
+        # States move between replicas, so a clone is yielded to leave
+        # earlier conformers unchanged.
+        conformer = supramolecule._with_components(  # noqa: SLF001
+            components=supramolecule.components,
+            centroids=supramolecule.get_component_centroids(),
+            position_matrices=supramolecule.get_component_position_matrices(),
+        )
+        conformer.cid = cid
+        conformer.potential = self._spinner._rescore(  # noqa: SLF001
+            supramolecule=conformer,
+            potential=nonbonded_potential,
+        )
+        return conformer
+
+    def get_final_conformer(
+        self,
+        supramolecule: SupraMolecule,
+        movable_components: tuple[int, ...] | None = None,
+    ) -> SupraMolecule:
+        """Get final conformer of supramolecule.
+
+        Parameters:
+            supramolecule:
+                The supramolecule to optimize.
+
+            movable_components:
+                Components of supramolecule to move during simulation.
+                If `None`, then moved components are selected randomly,
+                and the largest component (host) is not moved.
+
+        Returns:
+            conformer:
+                The host-guest supramolecule of the replica at the first
+                beta.
+
+        """
+        for conformer in self.get_conformers(  # noqa: B007
+            supramolecule=supramolecule,
+            movable_components=movable_components,
+        ):
+            continue
+
+        return conformer
+
+
+def _rotation_matrix(angle: float, axis: np.ndarray) -> np.ndarray:
+    """Get the matrix of a rotation by `angle` radians about `axis`.
+
+    Gives the same rotation as :func:`mch.rotation_matrix_arbitrary_axis`,
+    which projects onto the rotation of the normalised quaternion if
+    `axis` is not of unit magnitude, without the overhead of
+    :class:`scipy.spatial.transform.Rotation`.
+
+    """
+    sin = math.sin(angle / 2)
+    a = math.cos(angle / 2)
+    b, c, d = (float(i) * sin for i in axis)
+    norm = math.sqrt(a * a + b * b + c * c + d * d)
+    a, b, c, d = a / norm, b / norm, c / norm, d / norm
+    return np.array(
+        [
+            [
+                a * a + b * b - c * c - d * d,
+                2 * (b * c - a * d),
+                2 * (b * d + a * c),
+            ],
+            [
+                2 * (b * c + a * d),
+                a * a + c * c - b * b - d * d,
+                2 * (c * d - a * b),
+            ],
+            [
+                2 * (b * d - a * c),
+                2 * (c * d + a * b),
+                a * a + d * d - b * b - c * c,
+            ],
+        ]
+    )
+
+
+def _run_chain(
+    spinner: Spinner,
+    supramolecule: SupraMolecule,
+    movable_components: tuple[int, ...] | None,
+) -> SupraMolecule:
+    return spinner.get_final_conformer(
+        supramolecule=supramolecule,
+        movable_components=movable_components,
+    )
+
+
+def _run_chain_conformers(
+    spinner: Spinner,
+    supramolecule: SupraMolecule,
+    movable_components: tuple[int, ...] | None,
+) -> list[SupraMolecule]:
+    return list(
+        spinner.get_conformers(
+            supramolecule=supramolecule,
+            movable_components=movable_components,
+        )
+    )
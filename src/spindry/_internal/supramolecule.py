@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import mchammer as mch
-import networkx as nx
 import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
 
 if typing.TYPE_CHECKING:
     from collections import abc
 
+    import stk
+
 
 @dataclass
 class SupraMolecule(mch.Molecule):
@@ -41,6 +44,24 @@ class SupraMolecule(mch.Molecule):
     position_matrix: np.ndarray
     cid: int | None = None
     potential: float | None = None
+    _component_radii: tuple[np.ndarray, ...] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _component_centroids: tuple[np.ndarray, ...] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _component_position_matrices: tuple[np.ndarray, ...] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self) -> None:
         """Post initialization of molecule."""
@@ -76,6 +97,11 @@ class SupraMolecule(mch.Molecule):
         )
         # Overwrite redefined components.
         _temp_supramolecule.components = _temp_components
+        _temp_supramolecule._component_radii = self._component_radii
+        _temp_supramolecule._component_centroids = self._component_centroids
+        _temp_supramolecule._component_position_matrices = (
+            self._component_position_matrices
+        )
         return _temp_supramolecule
 
     def with_displacement(self, displacement: np.ndarray) -> SupraMolecule:
@@ -115,20 +141,15 @@ class SupraMolecule(mch.Molecule):
                 Potential energy of Supramolecule.
 
         """
-        atoms = []
-        bonds = []
-        position_matrix = []
+        atoms: list[mch.Atom] = []
+        bonds: list[mch.Bond] = []
         # Map old atom ids in components to atom ids in supramolecule.
+        # New ids are given in order, so the next id is the number of
+        # atoms (or bonds) added so far.
         atom_id_map: dict[int, int] = {}
-        bond_id_map: dict[int, int] = {}
         for comp in components:
             for a in comp.get_atoms():
-                if len(atom_id_map) == 0:
-                    atom_id_map[a.get_id()] = 0
-                else:
-                    atom_id_map[a.get_id()] = (
-                        max(list(atom_id_map.values())) + 1
-                    )
+                atom_id_map[a.get_id()] = len(atoms)
                 atoms.append(
                     mch.Atom(
                         id=atom_id_map[a.get_id()],
@@ -136,23 +157,18 @@ class SupraMolecule(mch.Molecule):
                     )
                 )
             for b in comp.get_bonds():
-                if len(bond_id_map) == 0:
-                    bond_id_map[b.get_id()] = 0
-                else:
-                    bond_id_map[b.get_id()] = (
-                        max(list(bond_id_map.values())) + 1
-                    )
                 bonds.append(
                     mch.Bond(
-                        id=bond_id_map[b.get_id()],
+                        id=len(bonds),
                         atom_ids=(
                             atom_id_map[b.get_atom1_id()],
                             atom_id_map[b.get_atom2_id()],
                         ),
                     )
                 )
-            for pos in comp.get_position_matrix():
-                position_matrix.append(pos)  # noqa: PERF402
+        position_matrix = np.concatenate(
+            [comp.get_position_matrix() for comp in components]
+        )
 
         supramolecule: SupraMolecule = cls.__new__(cls)
         supramolecule.atoms = tuple(atoms)
@@ -160,53 +176,226 @@ class SupraMolecule(mch.Molecule):
         supramolecule.components = tuple(components)
         supramolecule.cid = cid
         supramolecule.potential = potential
-        supramolecule.position_matrix = np.array(position_matrix).T
+        supramolecule.position_matrix = position_matrix.T
+        supramolecule._component_radii = None
+        supramolecule._component_centroids = None
+        supramolecule._component_position_matrices = None
+        return supramolecule
+
+    @classmethod
+    def init_from_stk_molecule(
+        cls,
+        molecule: stk.Molecule,
+    ) -> typing.Self:
+        """Initialize a :class:`Supramolecule` instance from a stk molecule.
+
+        This is a shorthand for building the atoms and bonds by hand, and
+        still creates one :class:`mchammer.Atom` and
+        :class:`mchammer.Bond` for each atom and bond of `molecule`.
+
+        Parameters:
+            molecule:
+                The :mod:`stk` molecule, whose disconnected components
+                define the supramolecule.
+
+        """
+        return cls(
+            atoms=tuple(
+                mch.Atom(
+                    id=atom.get_id(),
+                    element_string=atom.__class__.__name__,
+                )
+                for atom in molecule.get_atoms()
+            ),
+            bonds=tuple(
+                mch.Bond(
+                    id=i,
+                    atom_ids=(
+                        bond.get_atom1().get_id(),
+                        bond.get_atom2().get_id(),
+                    ),
+                )
+                for i, bond in enumerate(molecule.get_bonds())
+            ),
+            position_matrix=molecule.get_position_matrix(),
+        )
+
+    def _with_components(
+        self,
+        components: abc.Sequence[mch.Molecule],
+        centroids: abc.Sequence[np.ndarray] | None = None,
+        position_matrices: abc.Sequence[np.ndarray] | None = None,
+    ) -> SupraMolecule:
+        """Return a clone with moved, but otherwise identical, components.
+
+        The atoms, bonds and cached per-component radii are shared with
+        this supramolecule, so `components` must hold the same atoms, in
+        the same order, as the components of this supramolecule.
+
+        Parameters:
+            components:
+                The moved components.
+
+            centroids:
+                The centroids of `components`, if already known, which
+                are then cached on the clone.
+
+            position_matrices:
+                The ``(n, 3)`` position matrices of `components`, if
+                already known, which are then cached on the clone. They
+                are made read-only.
+
+        """
+        supramolecule: SupraMolecule = self.__class__.__new__(self.__class__)
+        supramolecule.atoms = self.atoms
+        supramolecule.bonds = self.bonds
+        supramolecule.components = tuple(components)
+        supramolecule.cid = None
+        supramolecule.potential = None
+        supramolecule.position_matrix = np.concatenate(
+            [i.position_matrix for i in supramolecule.components],
+            axis=1,
+        )
+        supramolecule._component_radii = self.get_component_radii()
+        supramolecule._component_centroids = (
+            None if centroids is None else tuple(centroids)
+        )
+        supramolecule._component_position_matrices = (
+            None
+            if position_matrices is None
+            else tuple(_read_only(i) for i in position_matrices)
+        )
         return supramolecule
 
     def _define_components(self) -> None:
         """Define disconnected component molecules as :class:`.Molecule`s."""
-        # Produce a graph from the molecule that does not include edges
-        # where the bonds to be optimized are.
-        mol_graph = nx.Graph()
-        for atom in self.get_atoms():
-            mol_graph.add_node(atom.get_id())
-
-        # Add edges.
-        for bond in self.bonds:
-            pair_ids = (bond.get_atom1_id(), bond.get_atom2_id())
-            mol_graph.add_edge(*pair_ids)
-
-        # Get atom ids in disconnected subgraphs.
-        comps = []
-        for c in nx.connected_components(mol_graph):
-            c_ids = sorted(c)
-            in_atoms = [i for i in self.atoms if i.get_id() in c]
-            in_bonds = [
-                i
-                for i in self.bonds
-                if i.get_atom1_id() in c and i.get_atom2_id() in c
-            ]
-            new_pos_matrix = self.position_matrix[:, list(c_ids)].T
-            comps.append(mch.Molecule(in_atoms, in_bonds, new_pos_matrix))
-
-        self.components = tuple(comps)
+        # Label the connected components of the bond graph, numbered in
+        # order of their first atom.
+        atom_indices = {
+            atom.get_id(): i for i, atom in enumerate(self.get_atoms())
+        }
+        bond_pairs = np.array(
+            [
+                (
+                    atom_indices[bond.get_atom1_id()],
+                    atom_indices[bond.get_atom2_id()],
+                )
+                for bond in self.bonds
+            ],
+            dtype=np.intp,
+        ).reshape(-1, 2)
+        num_atoms = len(atom_indices)
+        num_components, atom_labels = csgraph.connected_components(
+            csgraph=sparse.coo_matrix(
+                (
+                    np.ones(len(bond_pairs), dtype=np.int8),
+                    (bond_pairs[:, 0], bond_pairs[:, 1]),
+                ),
+                shape=(num_atoms, num_atoms),
+            ),
+            directed=False,
+        )
+
+        in_atoms: list[list[mch.Atom]] = [[] for _ in range(num_components)]
+        for atom, label in zip(self.atoms, atom_labels, strict=True):
+            in_atoms[label].append(atom)
+        in_bonds: list[list[mch.Bond]] = [[] for _ in range(num_components)]
+        for bond, label in zip(
+            self.bonds, atom_labels[bond_pairs[:, 0]], strict=True
+        ):
+            in_bonds[label].append(bond)
+
+        self.components = tuple(
+            mch.Molecule(
+                atoms,
+                bonds,
+                self.position_matrix[
+                    :, sorted(atom.get_id() for atom in atoms)
+                ].T,
+            )
+            for atoms, bonds in zip(in_atoms, in_bonds, strict=True)
+        )
 
     def write_xyz_content(self) -> list[str]:
         """Write basic `.xyz` file content of Molecule."""
-        coords = self.get_position_matrix()
-        content = ["0"]
-        for i, atom in enumerate(self.get_atoms(), 1):
-            x, y, z = (i for i in coords[atom.get_id()])
-            content.append(f"{atom.get_element_string()} {x:f} {y:f} {z:f}\n")
-        # Set first line to the atom_count.
-        content[0] = f"{i}\ncid:{self.cid}, pot: {self.potential}\n"
-
+        atoms = tuple(self.get_atoms())
+        # Gather all coordinates as Python floats in one call, which are
+        # much faster to format than NumPy scalars.
+        coords = self.position_matrix[
+            :, [atom.get_id() for atom in atoms]
+        ].T.tolist()
+        content = [f"{len(atoms)}\ncid:{self.cid}, pot: {self.potential}\n"]
+        content.extend(
+            f"{atom.get_element_string()} {x:f} {y:f} {z:f}\n"
+            for atom, (x, y, z) in zip(atoms, coords, strict=True)
+        )
         return content
 
     def get_components(self) -> abc.Iterable[mch.Molecule]:
         """Yields each molecular component."""
         yield from self.components
 
+    def get_component_position_matrices(self) -> tuple[np.ndarray, ...]:
+        """Get the position matrix of each component.
+
+        The matrices are cached and are read-only, unlike those returned
+        by :meth:`mch.Molecule.get_position_matrix`. Trial supramolecules
+        made by :class:`.Spinner` only replace the matrix of the
+        component moved in each step.
+
+        Returns:
+            One ``(n, 3)`` array for each component, ordered as
+            :meth:`get_components`.
+
+        """
+        if self._component_position_matrices is None:
+            self._component_position_matrices = tuple(
+                _read_only(comp.get_position_matrix())
+                for comp in self.components
+            )
+        return self._component_position_matrices
+
+    def get_component_radii(self) -> tuple[np.ndarray, ...]:
+        """Get the atomic radii of each component.
+
+        The radii are collected once and cached, because the atoms of a
+        supramolecule do not change between conformers.
+
+        Returns:
+            One read-only ``(n, )`` array of radii for each component,
+            ordered as :meth:`get_components`.
+
+        """
+        if self._component_radii is None:
+            self._component_radii = tuple(
+                _read_only(
+                    np.array(
+                        [atom.get_radius() for atom in comp.get_atoms()],
+                        dtype=np.float64,
+                    )
+                )
+                for comp in self.components
+            )
+        return self._component_radii
+
+    def get_component_centroids(self) -> tuple[np.ndarray, ...]:
+        """Get the centroid of each component.
+
+        The centroids are cached, and are carried over to the trial
+        supramolecules made by :class:`.Spinner`, which only update the
+        centroid of the component moved in each step.
+
+        Returns:
+            One ``(3, )`` array for each component, ordered as
+            :meth:`get_components`.
+
+        """
+        if self._component_centroids is None:
+            self._component_centroids = tuple(
+                comp.get_centroid() for comp in self.components
+            )
+        return self._component_centroids
+
     def get_cid(self) -> int | None:
         """Get conformer id."""
         return self.cid
@@ -227,3 +416,8 @@ class SupraMolecule(mch.Molecule):
             f"{len(list(self.get_components()))} components, "
             f"{comps})"
         )
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
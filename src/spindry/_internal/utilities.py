@@ -1,11 +1,18 @@
 """This module defines general-purpose objects, functions and classes."""
 
+from __future__ import annotations
+
 import itertools as it
+from typing import TYPE_CHECKING
 
 import numpy as np
 from scipy.spatial.distance import cdist, euclidean
 
-from .supramolecule import SupraMolecule
+if TYPE_CHECKING:
+    import pathlib
+    from collections import abc
+
+    from .supramolecule import SupraMolecule
 
 
 def get_atom_distance(
@@ -21,25 +28,48 @@ def get_atom_distance(
 
 def calculate_min_atom_distance(supramolecule: SupraMolecule) -> float:
     """Calculate the minimum distance between components in supramolecule."""
-    component_position_matrices = (
-        i.get_position_matrix() for i in supramolecule.get_components()
-    )
+    # Compare squared distances, and only take the square root of the
+    # smallest.
+    min_squared_distance = 1e48
+    for pos_mat_pair in it.combinations(
+        supramolecule.get_component_position_matrices(), 2
+    ):
+        min_squared_distance = min(
+            min_squared_distance,
+            cdist(pos_mat_pair[0], pos_mat_pair[1], "sqeuclidean").min(),
+        )
 
-    min_distance = 1e24
-    for pos_mat_pair in it.combinations(component_position_matrices, 2):
-        pair_dists = cdist(pos_mat_pair[0], pos_mat_pair[1])
-        min_distance = min([min_distance, min(pair_dists.flatten())])
-
-    return min_distance
+    return float(np.sqrt(min_squared_distance))
 
 
 def calculate_centroid_distance(supramolecule: SupraMolecule) -> float:
     """Calculate the centroid distances in 1:1 complex."""
-    comps = list(supramolecule.get_components())
-    if len(comps) != 2:  # noqa: PLR2004
+    centroids = supramolecule.get_component_centroids()
+    if len(centroids) != 2:  # noqa: PLR2004
         msg = "more than one guest there buddy!"
         raise ValueError(msg)
 
-    return float(
-        np.linalg.norm(comps[0].get_centroid() - comps[1].get_centroid())
-    )
+    return float(np.linalg.norm(centroids[0] - centroids[1]))
+
+
+def write_xyz_trajectory(
+    conformers: abc.Iterable[SupraMolecule],
+    path: str | pathlib.Path,
+) -> None:
+    """Write conformers to a single multi-frame `.xyz` file.
+
+    Connectivity is not maintained in this file type!
+
+    Parameters:
+        conformers:
+            The conformers to write, for example from
+            :meth:`.Spinner.get_conformers`. Each is written as one frame.
+
+        path:
+            Path of the file to write.
+
+    """
+    with open(path, "w") as f:
+        f.writelines(
+            "".join(conformer.write_xyz_content()) for conformer in conformers
+        )
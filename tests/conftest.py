@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import pathlib
+from typing import TYPE_CHECKING
+
 import mchammer as mch
 import numpy as np
 import pytest
 import spindry as spd
 
+if TYPE_CHECKING:
+    import stk
+
 
 @pytest.fixture(
     params=(
@@ -101,15 +107,30 @@ def nb_mins() -> list[int]:
 
 @pytest.fixture()
 def final_potential() -> float:
-    return -1.0663634766840466
+    return -0.3176881257389768
 
 
 @pytest.fixture()
 def final_pos_mat() -> np.ndarray:
     return np.array(
         [
-            [-0.25381207, -0.04314638, 0.16139028],
-            [-0.26145616, 1.90851203, 0.03076565],
+            [1.43181491, -0.18232963, -0.75916042],
+            [1.60680302, 1.32907075, 1.24387747],
+        ]
+    )
+
+
+@pytest.fixture()
+def tempering_final_potential() -> float:
+    return -1.248895223612607
+
+
+@pytest.fixture()
+def tempering_final_pos_mat() -> np.ndarray:
+    return np.array(
+        [
+            [0.40567647, -0.55861277, 0.15459604],
+            [-0.9173235, 0.07286075, -0.8827098],
         ]
     )
 
@@ -165,7 +186,7 @@ def final_comp_pos_mat1() -> np.ndarray:
         [
             [0.0, 0.0, 0.0],
             [0.0, 1.5, 0.0],
-            [-0.37630376, 4.19120278, 1.01555759],
+            [-1.39404788, 3.12378633, 0.13976332],
         ]
     )
 
@@ -179,14 +200,14 @@ def movable_components2() -> tuple:
 def final_comp_pos_mat2() -> np.ndarray:
     return np.array(
         [
-            [-0.07019955, 0.93799499, -0.22331631],
-            [1.06299353, 1.44346439, 0.61952064],
+            [-0.41455877, 1.24498725, 0.06459528],
+            [0.67037396, 0.25392058, 0.36577268],
             [0.0, 3.0, 0.0],
         ]
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def spd_spinner() -> spd.Spinner:
     return spd.Spinner(
         step_size=0.0,
@@ -195,7 +216,7 @@ def spd_spinner() -> spd.Spinner:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def spd_host() -> mch.Molecule:
     return mch.Molecule(
         atoms=[
@@ -451,7 +472,7 @@ def spd_host() -> mch.Molecule:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def spd_guest() -> mch.Molecule:
     return mch.Molecule(
         atoms=[
@@ -519,7 +540,7 @@ def spd_guest() -> mch.Molecule:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def spd_supramolecule() -> spd.SupraMolecule:
     return spd.SupraMolecule(
         atoms=[
@@ -829,6 +850,14 @@ def spd_supramolecule() -> spd.SupraMolecule:
     )
 
 
+@pytest.fixture(scope="session")
+def spd_final_conformer(
+    spd_spinner: spd.Spinner,
+    spd_supramolecule: spd.SupraMolecule,
+) -> spd.SupraMolecule:
+    return spd_spinner.get_final_conformer(spd_supramolecule)
+
+
 @pytest.fixture()
 def spd_supramolecule_by_comp(
     spd_host: mch.Molecule,
@@ -837,3 +866,15 @@ def spd_supramolecule_by_comp(
     return spd.SupraMolecule.init_from_components(
         components=(spd_host, spd_guest),
     )
+
+
+@pytest.fixture(scope="session")
+def known_spinner_molecule() -> stk.BuildingBlock:
+    # stk is only needed by the stk reproduction tests.
+    import stk  # noqa: PLC0415
+
+    return stk.BuildingBlock.init_from_file(
+        pathlib.Path(__file__).resolve().parent
+        / "stk_reproduction"
+        / "spinner.mol"
+    )
@@ -1,11 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 import numpy as np
 
-if TYPE_CHECKING:
-    import spindry as spd
+import spindry as spd
 
 
 def test_nonbond_potential(
@@ -14,12 +11,11 @@ def test_nonbond_potential(
     nonbond_potentials: list[float],
     nb_mins: list[int],
 ) -> None:
-    for i, d in enumerate(distances):
-        test = spdpotential._nonbond_potential(  # noqa: SLF001
-            distance=d,
-            sigmas=np.array(1.2),
-        )
-        assert np.isclose(test, nonbond_potentials[i], atol=1e-5)
+    test = spdpotential._nonbond_potential(  # noqa: SLF001
+        distance=distances,
+        sigmas=np.array(1.2),
+    )
+    assert np.allclose(test, nonbond_potentials, atol=1e-5)
 
     for i, _sigma in enumerate([1.2, 1.4, 1.8, 1.6]):
         test = spdpotential._nonbond_potential(  # noqa: SLF001
@@ -27,3 +23,186 @@ def test_nonbond_potential(
             sigmas=np.array(_sigma),
         )
         assert np.argmin(test**2) == nb_mins[i]
+
+
+def test_nonbond_cutoff(
+    smolecule: spd.SupraMolecule,
+    spdpotential: spd.SpdPotential,
+) -> None:
+    test = spd.SpdPotential(cutoff=10.0).compute_potential(smolecule)
+    assert np.isclose(test, spdpotential.compute_potential(smolecule))
+
+    # The only atom pair is 1.5 Angstrom apart.
+    test = spd.SpdPotential(cutoff=1.0).compute_potential(smolecule)
+    assert np.isclose(test, 0.0)
+
+
+def test_nonbond_cutoff_tree() -> None:
+    generator = np.random.default_rng(4)
+    position_matrices = (
+        generator.random((1000, 3)) * 30,
+        generator.random((1000, 3)) * 30,
+    )
+    radii = (np.full(1000, 1.5), np.full(1000, 1.2))
+
+    potential = spd.SpdPotential(cutoff=6.0)
+    test = potential._compute_nonbonded_potential(  # noqa: SLF001
+        position_matrices=position_matrices,
+        radii=radii,
+    )
+
+    distances = np.linalg.norm(
+        position_matrices[0][:, None] - position_matrices[1][None, :],
+        axis=2,
+    )
+    in_cutoff = distances < 6.0
+    ratio = 1.35 / distances[in_cutoff]
+    known = np.sum(5 * (ratio**12 - ratio**6))
+    assert np.isclose(test, known)
+
+
+def test_nonbond_potential_override(
+    smolecule: spd.SupraMolecule,
+    spdpotential: spd.SpdPotential,
+) -> None:
+    class HalfPotential(spd.SpdPotential):
+        def _nonbond_potential(
+            self,
+            distance: np.ndarray,
+            sigmas: np.ndarray,
+        ) -> np.ndarray:
+            return super()._nonbond_potential(distance, sigmas) / 2
+
+    test = HalfPotential().compute_potential(smolecule)
+    assert np.isclose(test, spdpotential.compute_potential(smolecule) / 2)
+
+
+def test_combine_sigma(
+    spdpotential: spd.SpdPotential,
+    radii_combinations: list[tuple],
+) -> None:
+    radii1, radii2, known = np.array(radii_combinations).T
+    test = spdpotential._combine_sigma(radii1, radii2)  # noqa: SLF001
+    assert np.allclose(np.diagonal(test), known)
+
+
+def test_squared_sigmas_cache(spdpotential: spd.SpdPotential) -> None:
+    radii = [np.full(2, 1.0), np.full(3, 2.0)]
+    test = spdpotential._get_squared_sigmas(radii)  # noqa: SLF001
+    assert np.allclose(test[0], 2.25)
+
+    # Writeable radii can be edited in place, so are never reused.
+    radii[1][:] = 3.0
+    test = spdpotential._get_squared_sigmas(radii)  # noqa: SLF001
+    assert np.allclose(test[0], 4.0)
+
+    for i in radii:
+        i.flags.writeable = False
+    test = spdpotential._get_squared_sigmas(radii)  # noqa: SLF001
+    assert spdpotential._get_squared_sigmas(tuple(radii)) is test  # noqa: SLF001
+
+
+def test_varying_epsilon_combine() -> None:
+    potential = spd.VaryingEpsilonPotential()
+
+    test = potential._combine_sigma((1.0, 2.0), (3.0,))  # noqa: SLF001
+    assert np.allclose(test, [[2.0], [2.5]])
+
+    test = potential._combine_epsilon((1.0, 4.0), (4.0, 9.0))  # noqa: SLF001
+    assert np.allclose(test, [[2.0, 3.0], [4.0, 6.0]])
+
+
+def test_nonbond_cutoff_tree_reuse() -> None:
+    generator = np.random.default_rng(4)
+    host = generator.random((2000, 3)) * 30
+    host.flags.writeable = False
+    radii = (np.full(2000, 1.5), np.full(10, 1.2))
+
+    potential = spd.SpdPotential(cutoff=6.0)
+    for displacement in (0.0, 3.0):
+        guest = generator.random((10, 3)) * 4 + 13 + displacement
+        guest.flags.writeable = False
+        test = potential._compute_nonbonded_potential(  # noqa: SLF001
+            position_matrices=(guest, host),
+            radii=radii[::-1],
+        )
+
+        distances = np.linalg.norm(host[:, None] - guest[None, :], axis=2)
+        in_cutoff = distances < 6.0
+        ratio = 1.35 / distances[in_cutoff]
+        known = np.sum(5 * (ratio**12 - ratio**6))
+        assert np.isclose(test, known)
+        assert len(potential._trees) == 1  # noqa: SLF001
+
+
+def test_nonbond_pair_reuse(
+    smolecule_components: spd.SupraMolecule,
+) -> None:
+    potential = spd.SpdPotential()
+    potential.compute_potential(smolecule_components)
+
+    components = list(smolecule_components.get_components())
+    components[0] = components[0].with_displacement(np.array([0, 0, 1.0]))
+    moved = smolecule_components._with_components(components)  # noqa: SLF001
+    test = potential.compute_potential(moved)
+
+    known = spd.SpdPotential().compute_potential(
+        spd.SupraMolecule.init_from_components(components)
+    )
+    assert np.isclose(test, known)
+    assert np.isclose(
+        potential.compute_potential(smolecule_components),
+        spd.SpdPotential().compute_potential(smolecule_components),
+    )
+
+
+def test_varying_epsilon_nonbond_potential(
+    distances: np.ndarray,
+    nonbond_potentials: list[float],
+) -> None:
+    # With an epsilon of 5, this matches the default SpdPotential.
+    test = spd.VaryingEpsilonPotential()._nonbond_potential(  # noqa: SLF001
+        distance=distances,
+        sigmas=np.full(len(distances), 1.2),
+        epsilons=np.full(len(distances), 5.0),
+    )
+    assert np.allclose(test, nonbond_potentials, atol=1e-5)
+
+
+def test_nonbond_clash(
+    smolecule: spd.SupraMolecule,
+    spdpotential: spd.SpdPotential,
+) -> None:
+    # The only atom pair is 1.5 Angstrom apart, with a sigma of 1.61.
+    test = spd.SpdPotential(clash_factor=0.5).compute_potential(smolecule)
+    assert np.isclose(test, spdpotential.compute_potential(smolecule))
+
+    test = spd.SpdPotential(clash_factor=0.95).compute_potential(smolecule)
+    assert test == np.inf
+
+
+def test_varying_epsilon_compute_potential(
+    smolecule_components: spd.SupraMolecule,
+    spdpotential: spd.SpdPotential,
+) -> None:
+    # With sigmas equal to the radii and epsilons of 5, this matches the
+    # default SpdPotential.
+    for atom in smolecule_components.get_atoms():
+        atom.sigma = atom.get_radius()
+        atom.epsilon = 5.0
+
+    components = list(smolecule_components.get_components())
+    components[-1] = components[-1].with_displacement(np.array([0, 1.0, 0]))
+    moved = smolecule_components._with_components(components)  # noqa: SLF001
+    assert not np.isclose(
+        spdpotential.compute_potential(moved),
+        spdpotential.compute_potential(smolecule_components),
+    )
+
+    potential = spd.VaryingEpsilonPotential()
+    # Later calls reuse the sigmas and epsilons of the first.
+    for test in (smolecule_components, moved, smolecule_components):
+        assert np.isclose(
+            potential.compute_potential(test),
+            spd.SpdPotential().compute_potential(test),
+        )
@@ -1,5 +1,8 @@
+import math
+
 import mchammer as mch
 import numpy as np
+import pytest
 import spindry as spd
 
 from tests.utilities import is_equivalent_spd_molecule
@@ -12,92 +15,201 @@ def test_opt(
     final_potential: float,
 ) -> None:
     test = spinner.get_final_conformer(smolecule)
-    print(test.get_position_matrix(), final_pos_mat)
-    assert np.all(
-        np.allclose(
-            final_pos_mat,
-            test.get_position_matrix(),
-        )
+    np.testing.assert_allclose(
+        test.get_position_matrix(),
+        final_pos_mat,
+        rtol=0,
+        atol=1e-6,
+    )
+    assert math.isclose(
+        spinner.compute_potential(test),
+        final_potential,
+        rel_tol=1e-5,
+        abs_tol=1e-8,
     )
-    print(spinner.compute_potential(test), final_potential)
-    assert np.isclose(spinner.compute_potential(test), final_potential)
 
 
 def test_opt_spd(
-    spd_spinner: spd.Spinner,
+    spd_final_conformer: spd.SupraMolecule,
     spd_host: mch.Molecule,
     spd_guest: mch.Molecule,
     spd_supramolecule: spd.SupraMolecule,
 ) -> None:
-    test = spd_spinner.get_final_conformer(spd_supramolecule)
+    test = spd_final_conformer
     is_equivalent_spd_molecule(test, spd_supramolecule)
-    for i, comp in enumerate(list(test.get_components())):
-        if i == 0:
-            test_host = spd_host.with_position_matrix(
-                comp.get_position_matrix()
-            )
-            is_equivalent_spd_molecule(test_host, spd_host)
-        elif i == 1:
-            test_guest = spd_guest.with_position_matrix(
-                comp.get_position_matrix()
-            )
-            is_equivalent_spd_molecule(test_guest, spd_guest)
+    host, guest, *_ = test.get_components()
+    test_host = spd_host.with_position_matrix(host.get_position_matrix())
+    is_equivalent_spd_molecule(test_host, spd_host)
+    test_guest = spd_guest.with_position_matrix(guest.get_position_matrix())
+    is_equivalent_spd_molecule(test_guest, spd_guest)
+
+    # With no step sizes, no component moves. Both are checked at once.
+    np.testing.assert_allclose(
+        np.concatenate(
+            [host.get_position_matrix(), guest.get_position_matrix()]
+        ),
+        np.concatenate(
+            [
+                i.get_position_matrix()
+                for i in spd_supramolecule.get_components()
+            ]
+        ),
+        rtol=0,
+        atol=1e-6,
+    )
 
 
 def test_opt_spd_components(
-    spd_spinner: spd.Spinner,
+    spd_final_conformer: spd.SupraMolecule,
     spd_host: mch.Molecule,
     spd_guest: mch.Molecule,
     spd_supramolecule: spd.SupraMolecule,
 ) -> None:
-    test = spd_spinner.get_final_conformer(spd_supramolecule)
+    test = spd_final_conformer
     is_equivalent_spd_molecule(test, spd_supramolecule)
-    for i, comp in enumerate(list(test.get_components())):
-        if i == 0:
-            test_host = spd_host.with_position_matrix(
-                comp.get_position_matrix()
-            )
-            is_equivalent_spd_molecule(test_host, spd_host)
-        elif i == 1:
-            test_guest = spd_guest.with_position_matrix(
-                comp.get_position_matrix()
-            )
-            is_equivalent_spd_molecule(test_guest, spd_guest)
-
-
-def test_opt_setcomp1(
+    host, guest, *_ = test.get_components()
+    test_host = spd_host.with_position_matrix(host.get_position_matrix())
+    is_equivalent_spd_molecule(test_host, spd_host)
+    test_guest = spd_guest.with_position_matrix(guest.get_position_matrix())
+    is_equivalent_spd_molecule(test_guest, spd_guest)
+
+
+@pytest.mark.parametrize(
+    ("movable_components", "final_comp_pos_mat"),
+    [
+        ("movable_components1", "final_comp_pos_mat1"),
+        ("movable_components2", "final_comp_pos_mat2"),
+    ],
+)
+def test_opt_setcomp(
+    request: pytest.FixtureRequest,
     spinner: spd.Spinner,
     smolecule_components: spd.SupraMolecule,
-    final_comp_pos_mat1: np.ndarray,
-    movable_components1: tuple,
+    movable_components: str,
+    final_comp_pos_mat: str,
 ) -> None:
+    known = request.getfixturevalue(final_comp_pos_mat)
     test = spinner.get_final_conformer(
         smolecule_components,
-        movable_components1,
+        request.getfixturevalue(movable_components),
+    )
+    np.testing.assert_allclose(
+        test.get_position_matrix(),
+        known,
+        rtol=0,
+        atol=1e-6,
+    )
+
+
+def test_opt_chains(
+    spinner: spd.Spinner,
+    smolecule: spd.SupraMolecule,
+    final_pos_mat: np.ndarray,
+) -> None:
+    serial = spinner.get_final_conformers(smolecule, random_seeds=(1000, 2))
+    np.testing.assert_allclose(
+        serial[0].get_position_matrix(),
+        final_pos_mat,
+        rtol=0,
+        atol=1e-6,
+    )
+
+    parallel = spinner.get_final_conformers(
+        smolecule,
+        random_seeds=(1000, 2),
+        num_processes=2,
     )
-    print(test.get_position_matrix(), final_comp_pos_mat1)
-    assert np.all(
-        np.allclose(
-            final_comp_pos_mat1,
+    for test, known in zip(parallel, serial, strict=True):
+        np.testing.assert_allclose(
             test.get_position_matrix(),
+            known.get_position_matrix(),
+            rtol=0,
+            atol=1e-6,
         )
+
+
+def test_opt_rescoring(smolecule_components: spd.SupraMolecule) -> None:
+    spinner = spd.Spinner(
+        step_size=0.5,
+        rotation_step_size=5,
+        num_conformers=10,
+        potential_function=spd.SpdPotential(cutoff=2.0),
+        rescoring_function=spd.SpdPotential(),
     )
+    tests = list(spinner.get_conformers(smolecule_components))
+    assert len(tests) > 1
+    for test in tests:
+        known = spd.SpdPotential().compute_potential(test)
+        assert math.isclose(test.get_potential(), known, rel_tol=1e-12)
+        # The cutoff drops at least one pair, so the MC potential differs.
+        assert not math.isclose(
+            spd.SpdPotential(cutoff=2.0).compute_potential(test),
+            known,
+            rel_tol=1e-6,
+        )
 
 
-def test_opt_setcomp2(
+def test_opt_chain_conformers(
     spinner: spd.Spinner,
-    smolecule_components: spd.SupraMolecule,
-    final_comp_pos_mat2: np.ndarray,
-    movable_components2: tuple,
+    smolecule: spd.SupraMolecule,
+    final_pos_mat: np.ndarray,
 ) -> None:
-    test = spinner.get_final_conformer(
-        smolecule_components,
-        movable_components2,
+    chains = spinner.get_chain_conformers(
+        smolecule,
+        random_seeds=(1000, 2),
+        num_processes=2,
     )
-    print(test.get_position_matrix(), final_comp_pos_mat2)
-    assert np.all(
-        np.allclose(
-            final_comp_pos_mat2,
-            test.get_position_matrix(),
+    assert len(chains) == 2
+    np.testing.assert_allclose(
+        chains[0][-1].get_position_matrix(),
+        final_pos_mat,
+        rtol=0,
+        atol=1e-6,
+    )
+    for chain in chains:
+        assert [i.get_cid() for i in chain] == list(range(len(chain)))
+
+
+def test_opt_parallel_tempering(  # noqa: PLR0917
+    spinner: spd.Spinner,
+    spdpotential: spd.SpdPotential,
+    smolecule: spd.SupraMolecule,
+    tempering_final_potential: float,
+    tempering_final_pos_mat: np.ndarray,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    tempering = spd.ParallelTemperingSpinner(
+        spinner=spinner,
+        betas=(2, 1, 0.5),
+        swap_every=5,
+    )
+    tests = list(tempering.get_conformers(smolecule, verbose=True))
+    assert "with 21 replica swaps." in capsys.readouterr().out
+    assert [i.get_cid() for i in tests] == list(range(len(tests)))
+    assert math.isclose(
+        tests[-1].get_potential(),
+        tempering_final_potential,
+        rel_tol=1e-5,
+        abs_tol=1e-8,
+    )
+    np.testing.assert_allclose(
+        tests[-1].get_position_matrix(),
+        tempering_final_pos_mat,
+        rtol=0,
+        atol=1e-6,
+    )
+    for test in tests:
+        assert math.isclose(
+            test.get_potential(),
+            spdpotential.compute_potential(test),
+            rel_tol=1e-5,
+            abs_tol=1e-8,
         )
+
+    final = tempering.get_final_conformer(smolecule)
+    np.testing.assert_allclose(
+        final.get_position_matrix(),
+        tests[-1].get_position_matrix(),
+        rtol=0,
+        atol=1e-6,
     )
@@ -1,11 +1,9 @@
-import pathlib
-
 import numpy as np
 import spindry as spd
 import stk
 
 
-def test_stk_spinner() -> None:
+def test_stk_spinner(known_spinner_molecule: stk.BuildingBlock) -> None:
     bb1 = stk.BuildingBlock(
         smiles="NCCN",
         functional_groups=[stk.PrimaryAminoFactory()],
@@ -78,21 +76,34 @@ def test_stk_spinner() -> None:
         position_matrix=conformer.get_position_matrix(),
     )
 
-    assert np.all(
-        np.equal(
-            complex_opt.get_position_matrix(),
-            new_complex.get_position_matrix(),
-        )
+    assert np.array_equal(
+        complex_opt.get_position_matrix(),
+        new_complex.get_position_matrix(),
     )
 
-    known = stk.BuildingBlock.init_from_file(
-        pathlib.Path(__file__).resolve().parent / "spinner.mol"
+    assert np.allclose(
+        known_spinner_molecule.get_position_matrix(),
+        new_complex.get_position_matrix(),
+        atol=1e-2,
     )
 
-    assert np.all(
-        np.isclose(
-            known.get_position_matrix(),
-            new_complex.get_position_matrix(),
-            atol=1e-2,
-        )
+
+def test_stk_init_from_stk_molecule(
+    known_spinner_molecule: stk.BuildingBlock,
+) -> None:
+    molecule = known_spinner_molecule
+    supramolecule = spd.SupraMolecule.init_from_stk_molecule(molecule)
+
+    assert supramolecule.get_num_atoms() == molecule.get_num_atoms()
+    assert len(list(supramolecule.get_components())) == 3
+    for atom, stk_atom in zip(
+        supramolecule.get_atoms(),
+        molecule.get_atoms(),
+        strict=True,
+    ):
+        assert atom.get_id() == stk_atom.get_id()
+        assert atom.get_element_string() == stk_atom.__class__.__name__
+    assert np.allclose(
+        supramolecule.get_position_matrix(),
+        molecule.get_position_matrix(),
     )
@@ -14,9 +14,47 @@ def test_smolecule_define_components(
             assert a1.get_id() == a2.get_id()
             assert a1.get_element_string() == a2.get_element_string()
 
-        assert np.all(
-            np.allclose(
-                test.get_position_matrix(),
-                comp.get_position_matrix(),
-            )
+        assert np.allclose(
+            test.get_position_matrix(),
+            comp.get_position_matrix(),
         )
+
+
+def test_smolecule_get_component_radii(
+    smolecule: spd.SupraMolecule,
+    components: list,
+) -> None:
+    tests = smolecule.get_component_radii()
+
+    assert len(tests) == len(components)
+    for test, comp in zip(tests, components, strict=True):
+        assert np.allclose(test, [i.get_radius() for i in comp.get_atoms()])
+
+    # Clones with new positions share the cached radii.
+    clone = smolecule.with_position_matrix(smolecule.get_position_matrix())
+    assert clone.get_component_radii() is tests
+
+
+def test_smolecule_get_component_centroids(
+    smolecule: spd.SupraMolecule,
+    position_matrix: np.ndarray,
+) -> None:
+    tests = smolecule.get_component_centroids()
+
+    # Each component is a single atom.
+    assert len(tests) == len(position_matrix)
+    for test, position in zip(tests, position_matrix, strict=True):
+        assert np.allclose(test, position)
+
+
+def test_smolecule_get_component_position_matrices(
+    smolecule: spd.SupraMolecule,
+    position_matrix: np.ndarray,
+) -> None:
+    tests = smolecule.get_component_position_matrices()
+
+    assert len(tests) == len(position_matrix)
+    for test, position in zip(tests, position_matrix, strict=True):
+        assert test.shape == (1, 3)
+        assert np.allclose(test, position)
+        assert not test.flags.writeable
@@ -1,5 +1,13 @@
+import pathlib
+
 import numpy as np
-from spindry import get_atom_distance
+from spindry import (
+    SupraMolecule,
+    calculate_centroid_distance,
+    calculate_min_atom_distance,
+    get_atom_distance,
+    write_xyz_trajectory,
+)
 
 
 def test_get_atom_distance() -> None:
@@ -12,3 +20,34 @@ def test_get_atom_distance() -> None:
     )
     assert get_atom_distance(position_matrix, 0, 1) == 1
     assert get_atom_distance(position_matrix, 0, 2) == 2
+
+
+def test_calculate_min_atom_distance(
+    smolecule_components: SupraMolecule,
+) -> None:
+    assert np.isclose(calculate_min_atom_distance(smolecule_components), 1.5)
+
+
+def test_calculate_centroid_distance(
+    smolecule_components: SupraMolecule,
+) -> None:
+    test = calculate_centroid_distance(smolecule_components)
+    assert np.isclose(test, 2.25)
+
+
+def test_write_xyz_trajectory(
+    tmp_path: pathlib.Path,
+    smolecule: SupraMolecule,
+    displaced_position_matrix: np.ndarray,
+) -> None:
+    conformers = (
+        smolecule,
+        smolecule.with_position_matrix(displaced_position_matrix),
+    )
+    path = tmp_path / "trajectory.xyz"
+    write_xyz_trajectory(conformers, path)
+
+    frames = path.read_text().split("\n")
+    assert frames[0] == "2"
+    assert frames[4] == "2"
+    assert frames[7].split() == ["C", "0.000000", "2.500000", "0.000000"]
@@ -1,5 +1,3 @@
-import itertools as it
-
 import mchammer as mch
 
 
@@ -24,17 +22,16 @@ def is_equivalent_spd_molecule(
     molecule2: mch.Molecule,
 ) -> None:
     """Test if molecules are equivalent."""
-    print(molecule1, molecule2)
-    atoms = it.zip_longest(
+    for atom1, atom2 in zip(
         molecule1.get_atoms(),
         molecule2.get_atoms(),
-    )
-    for atom1, atom2 in atoms:
+        strict=True,
+    ):
         is_equivalent_spd_atom(atom1, atom2)
 
-    bonds = it.zip_longest(
+    for bond1, bond2 in zip(
         molecule1.get_bonds(),
         molecule2.get_bonds(),
-    )
-    for bond1, bond2 in bonds:
+        strict=True,
+    ):
         is_equivalent_spd_bond(bond1, bond2)